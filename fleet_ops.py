@@ -1,7 +1,12 @@
 import os
 import sys
+import io
 import platform
 import time  # <--- Added this back so History works!
+import json
+import atexit
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # --- 1. AUTO-DETECT ENVIRONMENT ---
 if "com.termux" in os.environ.get("PREFIX", ""):
@@ -13,12 +18,17 @@ else:
 
 # --- IMPORTS ---
 try:
-    from git import Repo
+    from git import Repo, GitDB
+    from git.exc import GitCommandError, InvalidGitRepositoryError, NoSuchPathError
 except ImportError:
     print(f"❌ Critical Error on {DEVICE_NAME}: 'GitPython' is not installed.")
     sys.exit()
 
 # --- CONFIGURATION ---
+# Resolved once at import; both involve syscalls (realpath / getpwuid).
+SCRIPT_PATH = os.path.abspath(__file__)
+BASHRC_PATH = os.path.expanduser("~/.bashrc")
+
 DEFAULT_IGNORE = """
 __pycache__/
 *.pyc
@@ -27,6 +37,7 @@ __pycache__/
 env/
 venv/
 """
+DEFAULT_IGNORE_BYTES = DEFAULT_IGNORE.encode()
 
 def check_permissions():
     """Safety check for storage permissions and directory existence"""
@@ -41,22 +52,21 @@ def check_permissions():
 
 def setup_alias():
     """Injects the 'fleet' alias into .bashrc automatically"""
-    bashrc_path = os.path.expanduser("~/.bashrc")
-    script_path = os.path.abspath(__file__)
-    
-    alias_cmd = f'alias fleet="python {script_path}"'
-    
+    alias_cmd = f'alias fleet="python {SCRIPT_PATH}"'
+
     print(f"\n🛠️  Configuring Alias for {DEVICE_NAME}...")
-    
+
     try:
-        with open(bashrc_path, "r") as f:
-            if alias_cmd in f.read():
+        # Line-wise scan: stops at the first match and never loads a
+        # (potentially huge) .bashrc into memory.
+        with open(BASHRC_PATH, "r") as f:
+            if any(line.rstrip() == alias_cmd for line in f):
                 print("   ✅ 'fleet' alias is already active!")
                 return
     except FileNotFoundError:
-        pass 
-        
-    with open(bashrc_path, "a") as f:
+        pass
+
+    with open(BASHRC_PATH, "a") as f:
         f.write(f"\n{alias_cmd}\n")
     
     print("   ✨ Success! Alias added.")
@@ -65,150 +75,343 @@ def setup_alias():
 def create_gitignore(repo_path):
     """Creates a default .gitignore if missing"""
     ignore_path = os.path.join(repo_path, ".gitignore")
-    if not os.path.exists(ignore_path):
-        with open(ignore_path, "w") as f:
-            f.write(DEFAULT_IGNORE)
+    try:
+        # O_EXCL makes the exists-check and the create one atomic step.
+        fd = os.open(ignore_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        os.write(fd, DEFAULT_IGNORE_BYTES)
+        os.close(fd)
         print("      ✨ Created default .gitignore")
-    else:
+    except FileExistsError:
         print("      ⚠️  .gitignore already exists.")
 
+# Scan results keyed by repo path; entries stay valid until the repo's
+# .git metadata (HEAD / packed-refs / index) changes on disk.
+_STATUS_CACHE = {}
+
+# Repos whose remote recently failed to answer, mapped to the time of
+# the failure; their ls-remote check is skipped for a short window.
+_REMOTE_UNREACHABLE = {}
+_REMOTE_RETRY_SECS = 60
+
+# The cache survives between runs, so a fresh 'fleet' invocation skips
+# the git work for every repo whose .git files haven't moved.
+_CACHE_FILE = os.path.join(
+    os.path.expanduser(os.environ.get("XDG_CACHE_HOME", "~/.cache")),
+    "fleet", "status.json")
+
+def _load_cache():
+    """Seeds _STATUS_CACHE from the previous run, if any. A cache file
+    that can't be read or has the wrong shape is treated as empty -
+    never worth crashing the dashboard over."""
+    try:
+        with open(_CACHE_FILE) as f:
+            saved = json.load(f)
+        for path, (key, status, checked_at) in saved.items():
+            _STATUS_CACHE[path] = (tuple(key), status, checked_at)
+    except (OSError, ValueError, TypeError, AttributeError):
+        _STATUS_CACHE.clear()
+
+def _save_cache():
+    """Writes _STATUS_CACHE to disk (statuses are plain JSON data)."""
+    try:
+        os.makedirs(os.path.dirname(_CACHE_FILE), exist_ok=True)
+        with open(_CACHE_FILE, "w") as f:
+            json.dump(_STATUS_CACHE, f)
+    except OSError:
+        pass
+
+def _git_dir(repo_path):
+    """Resolves the actual git directory, handling the worktree/submodule
+    form where .git is a pointer file instead of a directory."""
+    dot_git = os.path.join(repo_path, ".git")
+    if os.path.isdir(dot_git):
+        return dot_git
+    try:
+        with open(dot_git) as f:
+            line = f.readline().strip()
+    except OSError:
+        return dot_git
+    if line.startswith("gitdir: "):
+        gitdir = line[len("gitdir: "):]
+        if not os.path.isabs(gitdir):
+            gitdir = os.path.join(repo_path, gitdir)
+        return gitdir
+    return dot_git
+
+def _mtime_key(repo_path):
+    """Fingerprint of a repo's git state, built from cheap stat calls.
+    Returns None when nothing could be stat'ed - that's not a stable
+    fingerprint, so such repos must not be cached."""
+    git_dir = _git_dir(repo_path)
+    key = []
+    for name in ("HEAD", "packed-refs", "index"):
+        try:
+            key.append(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+        except OSError:
+            key.append(None)
+    if all(mtime is None for mtime in key):
+        return None
+    return tuple(key)
+
 def get_git_status(repo_path):
-    """Returns a status dictionary for a single repo."""
+    """Returns a status dictionary for a single repo (cached on .git mtimes)."""
+    hit = _STATUS_CACHE.get(repo_path)
+    if hit and hit[0] is not None and hit[0] == _mtime_key(repo_path):
+        key, status, checked_at = hit
+        if time.time() - checked_at >= _REMOTE_RETRY_SECS:
+            # Local state hasn't moved, but another machine may have
+            # pushed - redo just the cheap ls-remote comparison, not
+            # the whole porcelain read.
+            try:
+                _check_remote(Repo(repo_path, odbt=GitDB), status)
+            except (InvalidGitRepositoryError, NoSuchPathError):
+                return status
+            _STATUS_CACHE[repo_path] = (key, status, time.time())
+        return status
+    status = _read_git_status(repo_path)
+    if status:
+        # Key taken *after* the read: 'git status' itself may refresh
+        # .git/index, and a key from before would be stale immediately.
+        key = _mtime_key(repo_path)
+        if key is not None:
+            _STATUS_CACHE[repo_path] = (key, status, time.time())
+    return status
+
+def _read_git_status(repo_path):
+    """Does the actual git work behind get_git_status."""
     try:
-        repo = Repo(repo_path)
+        repo = Repo(repo_path, odbt=GitDB)
         status = {
             "path": repo_path, 
             "name": os.path.basename(repo_path), 
             "dirty": False, 
             "ahead": 0, 
-            "behind": 0, 
-            "repo": repo,
-            "branch": "unknown"
+            "behind": 0,
+            "branch": "unknown",
+            "upstream": None,
+            "changed_files": []
         }
-        
-        try:
-            status["branch"] = repo.active_branch.name
-        except:
-            status["branch"] = "DETACHED"
 
-        if repo.is_dirty(untracked_files=True):
-            status["dirty"] = True
+        # One subprocess gives us branch name, upstream, ahead/behind
+        # (vs. the tracking ref) and the changed-file list all at once.
+        # Untracked files are skipped here - enumerating them walks the
+        # whole working tree, and the summary view only needs "dirty?".
+        # show_file_details lists them when the user drills in.
+        raw = repo.git.status('--porcelain=v2', '--branch', '-z', '--untracked-files=no')
+        records = iter(raw.split('\0'))
+        for record in records:
+            if not record:
+                continue
+            if record.startswith('# branch.head '):
+                head = record.split(' ', 2)[2]
+                status["branch"] = "DETACHED" if head == '(detached)' else head
+            elif record.startswith('# branch.upstream '):
+                status["upstream"] = record.split(' ', 2)[2]
+            elif record.startswith('# branch.ab '):
+                ahead_str, behind_str = record.split(' ')[2:4]
+                status["ahead"] = int(ahead_str)
+                status["behind"] = abs(int(behind_str))
+            elif record.startswith('1 '):
+                status["dirty"] = True
+                status["changed_files"].append(record.split(' ', 8)[-1])
+            elif record.startswith('2 '):
+                status["dirty"] = True
+                status["changed_files"].append(record.split(' ', 9)[-1])
+                next(records, None)  # -z renames carry the original path as an extra record
+            elif record.startswith('u '):
+                status["dirty"] = True
+                status["changed_files"].append(record.split(' ', 10)[-1])
 
-        try:
-            origin = repo.remotes.origin
-            origin.fetch()
-            local_branch = repo.active_branch
-            remote_branch = local_branch.tracking_branch()
-            
-            if remote_branch:
-                status["behind"] = sum(1 for c in repo.iter_commits(f'{local_branch.name}..{remote_branch.name}'))
-                status["ahead"] = sum(1 for c in repo.iter_commits(f'{remote_branch.name}..{local_branch.name}'))
-        except:
-            pass 
+        _check_remote(repo, status)
         return status
-    except:
+    except (InvalidGitRepositoryError, NoSuchPathError, GitCommandError):
+        # Not a readable repo (or git itself choked); the scan shows
+        # nothing for this folder rather than crashing the dashboard.
         return None
 
+def _check_remote(repo, status):
+    """Compares the live remote head against local HEAD and updates
+    ahead/behind in place. Cheap enough to redo on a TTL for cached
+    statuses, since a push from another machine changes nothing locally."""
+    repo_path = status["path"]
+    failed_at = _REMOTE_UNREACHABLE.get(repo_path)
+    if failed_at is not None and time.monotonic() - failed_at < _REMOTE_RETRY_SECS:
+        # This remote timed out moments ago; don't pay the timeout
+        # again on every refresh. Fall back to the tracking-ref counts.
+        status["remote_unreachable"] = True
+        return
+    if not status.get("upstream"):
+        return
+    # Read-only check: ask the remote for its head SHA instead of
+    # fetching pack data. The real fetch happens in sync_repo if
+    # the user decides to pull.
+    try:
+        remote_sha = repo.git.ls_remote('--heads', 'origin', status["branch"]).split()[0]
+        local_sha = repo.head.commit.hexsha
 
-def show_git_log(repo_path):
+        if remote_sha == local_sha:
+            # Live remote agrees with us; the tracking-ref counts
+            # from the porcelain header may just be stale.
+            status["ahead"] = 0
+            status["behind"] = 0
+        else:
+            try:
+                # One subprocess returns both counts; no Commit
+                # objects get built on the Python side.
+                out = repo.git.rev_list('--left-right', '--count', f'{remote_sha}...{local_sha}')
+                behind_str, ahead_str = out.split()
+                status["behind"] = int(behind_str)
+                status["ahead"] = int(ahead_str)
+            except GitCommandError:
+                # Remote commits we haven't fetched yet - we can't
+                # count them, but we know we're behind.
+                status["behind"] = max(status["behind"], 1)
+        _REMOTE_UNREACHABLE.pop(repo_path, None)
+        status.pop("remote_unreachable", None)
+    except (GitCommandError, IndexError):
+        # Unreachable or misconfigured remote (or the branch is
+        # gone from it). Remember that so the next refreshes skip
+        # the round-trip instead of re-timing-out.
+        _REMOTE_UNREACHABLE[repo_path] = time.monotonic()
+        status["remote_unreachable"] = True
+
+
+def show_git_log(repo_data):
     """Shows the last 5 commits (Time Travel View)"""
     try:
-        repo = Repo(repo_path)
-        # Get the name of the current branch for display
-        try:
-            branch_name = repo.active_branch.name
-        except:
-            branch_name = "HEAD"
-            
-        print(f"\n   📜 History for {os.path.basename(repo_path)} [{branch_name}]:")
-        
-        # FIX: Removed 'master'. Now defaults to the current active branch.
-        commits = list(repo.iter_commits(max_count=5))
-        
-        for commit in commits:
-            commit_date = time.strftime("%Y-%m-%d %H:%M", time.localtime(commit.committed_date))
-            print(f"      🔹 [{commit_date}] {commit.message.strip()} ({commit.author.name})")
+        repo = Repo(repo_data['path'], odbt=GitDB)
+        # The scan already resolved the branch name; detached or unknown
+        # heads just log from wherever HEAD points.
+        branch = repo_data['branch']
+        if branch in ("DETACHED", "unknown"):
+            branch = "HEAD"
+
+        print(f"\n   📜 History for {repo_data['name']} [{branch}]:")
+
+        # Raw 'git log' with a parse-friendly format: one subprocess,
+        # no Commit object allocation.
+        out = repo.git.log('-n', '5', '--pretty=format:%ct\t%an\t%s', branch)
+
+        for line in out.splitlines():
+            ts, author, msg = line.split('\t', 2)
+            print(f"      🔹 [{datetime.fromtimestamp(int(ts)):%Y-%m-%d %H:%M}] {msg} ({author})")
             
     except Exception as e:
         print(f"      ❌ Could not read history: {e}")
-def show_file_details(repo):
+def show_file_details(repo_data, out=sys.stdout):
     """Lists specifically which files are changed"""
-    print(f"\n   📄 File Status for [{os.path.basename(repo.working_dir)}]:")
-    
-    for item in repo.index.diff(None):
-        print(f"      ✏️  Modified: {item.a_path}")
-        
+    print(f"\n   📄 File Status for [{repo_data['name']}]:", file=out)
+
+    # Changed paths were already parsed out of the scan's porcelain
+    # status call - no Diff objects, no extra subprocess.
+    for item in repo_data['changed_files']:
+        print(f"      ✏️  Modified: {item}", file=out)
+
+    # Untracked files are only enumerated here, on the drill-in path.
+    repo = Repo(repo_data['path'], odbt=GitDB)
     for item in repo.untracked_files:
-        print(f"      🆕 New File: {item}")
-        
-    print("")
+        print(f"      🆕 New File: {item}", file=out)
 
-def sync_repo(repo_data, auto_message="Auto-sync via Fleet Commander"):
-    """Helper to sync a single repo"""
-    print(f"   ⚙️  Processing: {repo_data['name']}...")
-    repo = repo_data['repo']
-    
-    if repo_data['dirty']:
-        show_file_details(repo) 
+    print("", file=out)
+
+def sync_repo(repo_data, auto_message="Auto-sync via Fleet Commander", out=sys.stdout):
+    """Helper to sync a single repo. Writes progress to out, so batch
+    workers can buffer their lines instead of interleaving on stdout."""
+    print(f"   ⚙️  Processing: {repo_data['name']}...", file=out)
+    # Opened on demand - scan results only carry plain data, so repos the
+    # user never touches don't hold file handles for the whole session.
+    repo = Repo(repo_data['path'], odbt=GitDB)
+
+    # The scan's dirty bit deliberately ignores untracked files, so
+    # re-check them here at act time - they still need committing.
+    has_changes = repo_data['dirty'] or bool(repo.untracked_files)
+    if has_changes:
+        show_file_details(repo_data, out=out)
         repo.git.add(all=True)
         repo.index.commit(auto_message)
-        print("      ✅ Local changes saved.")
+        print("      ✅ Local changes saved.", file=out)
     
     try:
         origin = repo.remotes.origin
         if repo_data['behind'] > 0:
             origin.pull()
-            print("      ✅ Pulled down new changes.")
-        if repo_data['dirty'] or repo_data['ahead'] > 0:
+            print("      ✅ Pulled down new changes.", file=out)
+        if has_changes or repo_data['ahead'] > 0:
             origin.push()
-            print("      ✅ Pushed up to Cloud.")
-            
-        if not repo_data['dirty'] and repo_data['ahead'] == 0 and repo_data['behind'] == 0:
-            print("      ✨ Already clean.")
-            
+            print("      ✅ Pushed up to Cloud.", file=out)
+
+        if not has_changes and repo_data['ahead'] == 0 and repo_data['behind'] == 0:
+            print("      ✨ Already clean.", file=out)
+
     except Exception as e:
-        print(f"      ❌ Error syncing: {e}")
+        print(f"      ❌ Error syncing: {e}", file=out)
+    finally:
+        # We just committed/pushed/pulled, so the cached scan is stale.
+        _STATUS_CACHE.pop(repo_data['path'], None)
 
 def main_dashboard():
     if not check_permissions():
         input("Press Enter to exit...")
         return
 
+    _load_cache()
+    atexit.register(_save_cache)
+
     while True:
         os.system('clear') 
         print(f"\n🌍 --- FLEET COMMANDER: {DEVICE_NAME} ---")
         print(f"Scanning Sector: {ROOT_DIR}\n")
         
         repos_found = []
-        
-        # SCAN
+
+        # SCAN (all repos fetched in parallel - the network waits overlap)
         try:
+            paths = []
             if os.path.exists(ROOT_DIR):
-                folder_list = sorted(os.listdir(ROOT_DIR))
-                for folder_name in folder_list:
-                    folder_path = os.path.join(ROOT_DIR, folder_name)
-                    if os.path.isdir(folder_path) and os.path.isdir(os.path.join(folder_path, ".git")):
-                        stat = get_git_status(folder_path)
-                        if stat:
-                            repos_found.append(stat)
-                            
-                            icon = "✅"
-                            msg = "Synced"
-                            if stat["dirty"]:
-                                icon = "⚠️ "
-                                msg = "Unsaved Work"
-                            elif stat["ahead"] > 0:
-                                icon = "⬆️ "
-                                msg = f"Ahead (+{stat['ahead']})"
-                            elif stat["behind"] > 0:
-                                icon = "⬇️ "
-                                msg = f"Behind (-{stat['behind']})"
-                            
-                            print(f" {len(repos_found)}. {icon} {stat['name']:<18} [{stat['branch']}] | {msg}")
+                # scandir caches is_dir() from the readdir data, so only
+                # the .git probe costs an extra stat per candidate.
+                # Default is_dir() follows symlinks like os.path.isdir
+                # did, so symlinked repo folders still show up; regular
+                # directories are answered from the readdir data anyway.
+                with os.scandir(ROOT_DIR) as it:
+                    entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+                for entry in entries:
+                    # lexists (not isdir) so worktrees/submodules, where
+                    # .git is a link file, count as repos too.
+                    if os.path.lexists(os.path.join(entry.path, ".git")):
+                        paths.append(entry.path)
+
+            # Numbers are assigned at submission (sorted path order), so
+            # rows can print the moment their repo answers without the
+            # menu numbering shifting between refreshes.
+            repos_found = [None] * len(paths)
+            if paths:
+                with ThreadPoolExecutor(max_workers=min(32, len(paths))) as ex:
+                    futures = {ex.submit(get_git_status, path): idx for idx, path in enumerate(paths)}
+                    for future in as_completed(futures):
+                        idx = futures[future]
+                        stat = future.result()
+                        repos_found[idx] = stat
+                        if not stat:
+                            continue
+
+                        icon = "✅"
+                        msg = "Synced"
+                        if stat["dirty"]:
+                            icon = "⚠️ "
+                            msg = "Unsaved Work"
+                        elif stat["ahead"] > 0:
+                            icon = "⬆️ "
+                            msg = f"Ahead (+{stat['ahead']})"
+                        elif stat["behind"] > 0:
+                            icon = "⬇️ "
+                            msg = f"Behind (-{stat['behind']})"
+
+                        print(f" {idx + 1}. {icon} {stat['name']:<18} [{stat['branch']}] | {msg}")
         except OSError as e:
             print(f"❌ Error scanning: {e}")
 
-        if not repos_found:
+        if not any(repos_found):
             print(f"No repositories found in {ROOT_DIR}")
 
         print("\n-------------------------------------------")
@@ -234,29 +437,39 @@ def main_dashboard():
                 input("   Press Enter...")
             elif sub == '2':
                 idx = int(input(f"   Repo Number (1-{len(repos_found)}): ")) - 1
-                if 0 <= idx < len(repos_found):
+                if 0 <= idx < len(repos_found) and repos_found[idx]:
                     create_gitignore(repos_found[idx]['path'])
                 input("   Press Enter...")
         
         elif choice == 'l':
             idx = int(input(f"   Repo Number (1-{len(repos_found)}): ")) - 1
-            if 0 <= idx < len(repos_found):
-                show_git_log(repos_found[idx]['path'])
+            if 0 <= idx < len(repos_found) and repos_found[idx]:
+                show_git_log(repos_found[idx])
             input("   Press Enter...")
 
         elif choice == 'a':
             print("\n🚀 STARTING BATCH SYNC...")
-            for repo_data in repos_found:
-                sync_repo(repo_data)
+
+            def _sync_buffered(repo_data):
+                buf = io.StringIO()
+                sync_repo(repo_data, out=buf)
+                return buf.getvalue()
+
+            # A few workers overlap the network waits; kept low so we
+            # don't hammer the remote / ssh-agent with the whole fleet.
+            with ThreadPoolExecutor(max_workers=4) as ex:
+                for output in ex.map(_sync_buffered, (r for r in repos_found if r)):
+                    print(output, end="")
             input("\nBatch complete! Press Enter...")
         elif choice.isdigit():
             idx = int(choice) - 1
-            if 0 <= idx < len(repos_found):
+            if 0 <= idx < len(repos_found) and repos_found[idx]:
                 target = repos_found[idx]
                 print(f"\n🚀 Managing: {target['name']}")
                 
-                if target['dirty']:
-                    show_file_details(target['repo'])
+                # Always shown: the scan's dirty bit skips untracked
+                # files, and this is exactly where they get enumerated.
+                show_file_details(target)
                 
                 if input("   Sync this repo? (y/n): ").lower() == 'y':
                     sync_repo(target, auto_message=input("   Enter commit message (or Enter for auto): ") or "Update via Fleet Commander")